@@ -51,6 +51,9 @@ class FuzzyNetwork(object):
     - y_test  : testing output data
         - shape: (test_*,)
 
+    - data may be passed as NumPy arrays or pandas objects
+      and is stored as contiguous float32 NumPy arrays
+
     Attributes
     ==========
     - prob_type : str
@@ -98,6 +101,8 @@ class FuzzyNetwork(object):
         - get current weights from any layer in model
     - get_layer_output :
         - get test output from any layer in model
+    - fuzzy_firing :
+        - fuzzy layer output computed directly with NumPy
 
     Protected Methods
     =================
@@ -105,6 +110,8 @@ class FuzzyNetwork(object):
         - initialize neuron centers
     - initialize_widths :
         - initialize neuron weights based on parameter
+    - clear_output_caches :
+        - drop cached test-set outputs after weight changes
     """
     def __init__(self,
                  X_train, X_test, y_train, y_test,           # data attributes
@@ -123,11 +130,26 @@ class FuzzyNetwork(object):
         self.prob_type = prob_type
 
         # set data attributes
+        # convert pandas objects up front so hot paths
+        # never pay a .values copy per call
+        X_train = getattr(X_train, 'values', X_train)
+        X_test = getattr(X_test, 'values', X_test)
+        y_train = getattr(y_train, 'values', y_train)
+        y_test = getattr(y_test, 'values', y_test)
+
         # validate numpy arrays
         for data in [X_train, X_test, y_train, y_test]:
             if type(data) is not np.ndarray:
                 raise ValueError("Input data must be NumPy arrays")
 
+        # store data as contiguous float32 arrays
+        # - halves bytes moved versus float64 and saves
+        #   Keras from converting on every call
+        X_train = np.ascontiguousarray(X_train, dtype=np.float32)
+        X_test = np.ascontiguousarray(X_test, dtype=np.float32)
+        y_train = np.ascontiguousarray(y_train, dtype=np.float32)
+        y_test = np.ascontiguousarray(y_test, dtype=np.float32)
+
         # validate one-hot-encoded y values if classification
         if self.prob_type == 'classification':
             # convert to one-hot-encoding if y is one dimensional
@@ -175,6 +197,11 @@ class FuzzyNetwork(object):
         self._ifpart_samples = ifpart_samples
         self._err_delta = err_delta
 
+        # cached test-set outputs reused between criterion checks
+        # - dropped whenever model weights change
+        self._y_pred_cache = None
+        self._phi_cache = None
+
         # define model and set model attribute
         self.model = None
         self.build_model(**kwargs)
@@ -265,6 +292,9 @@ class FuzzyNetwork(object):
                       name='FuzzyNetwork', **kwargs)
         self.model = model
 
+        # replacing the model makes cached outputs stale
+        self._clear_output_caches()
+
         if self._debug:
             print('...Model successfully built!')
 
@@ -369,6 +399,9 @@ class FuzzyNetwork(object):
         # fit model to dataset
         self.model.fit(self.X_train, self.y_train, **kwargs)
 
+        # training changed weights so cached outputs are stale
+        self._clear_output_caches()
+
     def model_predictions(self):
         """
         Evaluate currently trained model and return predictions
@@ -380,9 +413,10 @@ class FuzzyNetwork(object):
             - predicted values
             - shape: (samples,) or (samples, classes)
         """
-        # get prediction values
-        preds = self.model.predict(self.X_test)
-        return preds
+        # reuse cached prediction values until weights change
+        if self._y_pred_cache is None:
+            self._y_pred_cache = self.model.predict(self.X_test)
+        return self._y_pred_cache
 
     def model_evaluation(self):
         """
@@ -408,7 +442,7 @@ class FuzzyNetwork(object):
         y_pred = self.model_predictions()
         return mean_absolute_error(self.y_test, y_pred) <= self._err_delta
 
-    def if_part_criterion(self):
+    def if_part_criterion(self, phi=None):
         """
         Check if-part criterion for neuron-adding process
             - considers whether current fuzzy rules suitably cover inputs
@@ -417,6 +451,12 @@ class FuzzyNetwork(object):
             - test whether max val at or above threshold
             - overall criterion met if criterion met for "ifpart_samples" % of samples
 
+        Parameters
+        ==========
+        phi : np.array
+            - precomputed fuzzy layer output to check
+            - defaults to running fuzzy layer on X_test
+
         Returns
         =======
         - True:
@@ -429,11 +469,12 @@ class FuzzyNetwork(object):
             raise ValueError('Percentage threshold must be between 0 and 1')
 
         # get max val
-        fuzz_out = self.get_layer_output(1)
+        fuzz_out = phi if phi is not None else self.fuzzy_firing()
         # check if max neuron output is above threshold
-        maxes = np.max(fuzz_out, axis=-1) >= self._ifpart_thresh
-        # return True if at least half of samples agree
-        return (maxes.sum() / len(maxes)) >= self._ifpart_samples
+        # single boolean compare with no integer intermediate
+        maxes = fuzz_out.max(axis=-1) >= self._ifpart_thresh
+        # return True if at least "ifpart_samples" % of samples agree
+        return maxes.mean() >= self._ifpart_samples
 
     def get_layer(self, layer=None):
         """
@@ -472,7 +513,7 @@ class FuzzyNetwork(object):
         """
         return self.get_layer(layer).get_weights()
 
-    def get_layer_output(self, layer=None):
+    def get_layer_output(self, layer=None, X=None):
         """
         Get output of layer based on input parameter
             - exception of Input layer
@@ -482,12 +523,67 @@ class FuzzyNetwork(object):
         layer : str or int
             - layer to get test output from
             - input can be layer name or index
+        X : np.array
+            - input data to run through model
+            - defaults to X_test
         """
+        # default to test data
+        if X is None:
+            X = self.X_test
+
         # create prediction from intermediate model ending at desired layer
         last_layer = self.get_layer(layer)
         intermediate_model = Model(inputs=self.model.input,
                                    outputs=last_layer.output)
-        return intermediate_model.predict(self.X_test)
+        return intermediate_model.predict(X)
+
+    def fuzzy_firing(self, X=None):
+        """
+        Fuzzy layer output computed directly with NumPy
+
+        - same Gaussian firing as FuzzyLayer:
+            phi(j) = exp{-sum[i=1,r;
+                        [x(i) - c(i,j)]^2 / [2 * sigma(i,j)^2]]}
+        - avoids invoking the Keras graph when only
+          firing levels are needed
+
+        Parameters
+        ==========
+        X : np.array
+            - input data to run through fuzzy layer
+            - defaults to X_test
+
+        Returns
+        =======
+        phi : np.array
+            - output of each neuron in fuzzy layer
+            - shape: (samples, neurons)
+        """
+        # default to test data
+        # and reuse cached firing levels until weights change
+        use_cache = X is None
+        if use_cache:
+            if self._phi_cache is not None:
+                return self._phi_cache
+            X = self.X_test
+
+        # standardized distance of each sample to each center
+        c, s = self.get_layer_weights(1)
+        z = (X[:, :, np.newaxis] - c[np.newaxis, :, :]) / s[np.newaxis, :, :]
+
+        # einsum fuses the square and feature-axis sum in one pass
+        phi = np.exp(-0.5 * np.einsum('sfn,sfn->sn', z, z))
+        if use_cache:
+            self._phi_cache = phi
+        return phi
+
+    def _clear_output_caches(self):
+        """
+        Drop cached test-set predictions and firing levels
+            - call after any change to model weights
+        """
+        self._y_pred_cache = None
+        self._phi_cache = None
 
     def _initialize_centers(self, random=True):
         """
@@ -519,6 +615,9 @@ class FuzzyNetwork(object):
         assert np.allclose(start_weights[0], final_weights[0])
         assert np.allclose(start_weights[1], final_weights[1])
 
+        # weights changed so cached outputs are stale
+        self._clear_output_caches()
+
     def _initialize_widths(self, s_0=4.0):
         """
         Initialize neuron widths
@@ -541,3 +640,6 @@ class FuzzyNetwork(object):
         final_weights = self.get_layer_weights(1)
         assert np.allclose(start_weights[0], final_weights[0])
         assert np.allclose(start_weights[1], final_weights[1])
+
+        # weights changed so cached outputs are stale
+        self._clear_output_caches()
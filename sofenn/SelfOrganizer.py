@@ -19,12 +19,199 @@ import numpy as np
 
 from keras.models import clone_model, Model
 
-from sklearn.metrics import mean_absolute_error, mean_squared_error
+from sklearn.metrics import mean_squared_error
 
 # custom Fuzzy Layers
 from .FuzzyNetwork import FuzzyNetwork
 from .layers import FuzzyLayer, NormalizedLayer, WeightedLayer, OutputLayer
 
+# optional Numba acceleration for numeric kernels
+# - falls back to NumPy implementations when not installed
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _min_dist_vector_nb(x, c):
+    """
+    Numba kernel for minimum distance vector
+
+    - average absolute distance between each sample
+      and each neuron center
+    - explicit loops fuse subtract/abs/accumulate
+      into one pass with no temporaries
+
+    Parameters
+    ==========
+    x : np.array
+        - input data
+        - shape: (samples, features)
+    c : np.array
+        - neuron centers
+        - shape: (features, neurons)
+
+    Returns
+    =======
+    min_dist : np.array
+        - shape: (features, neurons)
+    """
+    samples, features = x.shape
+    neurons = c.shape[1]
+    min_dist = np.zeros((features, neurons))
+    # parallelize over features - each thread owns one output row
+    for i in prange(features):
+        for n in range(samples):
+            for j in range(neurons):
+                min_dist[i, j] += abs(x[n, i] - c[i, j])
+    return min_dist / samples
+
+
+def _new_neuron_weights_nb(x, c, s, min_dist, dist_thresh):
+    """
+    Numba kernel for new neuron weight calculation
+
+    - for each feature, take center/width of closest neuron
+      when within threshold distance of mean feature value,
+      otherwise fall back to mean feature value and distance
+
+    Parameters
+    ==========
+    x : np.array
+        - input data
+        - shape: (samples, features)
+    c, s : np.array
+        - neuron centers and widths
+        - shape: (features, neurons)
+    min_dist : np.array
+        - average minimum distance vector across samples
+        - shape: (features, neurons)
+    dist_thresh : float
+        - multiplier of average feature values to use as distance thresholds
+
+    Returns
+    =======
+    ck, sk : np.array
+        - new center and width weight vectors
+        - shape: (features,)
+    """
+    samples, features = x.shape
+    neurons = c.shape[1]
+    ck = np.empty(features)
+    sk = np.empty(features)
+    # features are independent - parallelize across them
+    for i in prange(features):
+        # closest neuron and its distance for feature
+        min_j = 0
+        for j in range(1, neurons):
+            if min_dist[i, j] < min_dist[i, min_j]:
+                min_j = j
+        dist = min_dist[i, min_j]
+
+        # mean feature value across samples
+        x_mean = 0.0
+        for n in range(samples):
+            x_mean += x[n, i]
+        x_mean /= samples
+
+        # threshold distance as factor of mean feature value
+        if dist <= x_mean * dist_thresh:
+            ck[i] = c[i, min_j]
+            sk[i] = s[i, min_j]
+        else:
+            ck[i] = x_mean
+            sk[i] = dist
+    return ck, sk
+
+
+# compile kernels when Numba is available
+if njit is not None:
+    _min_dist_vector_nb = njit(cache=True, fastmath=True,
+                               parallel=True)(_min_dist_vector_nb)
+    _new_neuron_weights_nb = njit(cache=True, fastmath=True,
+                                  parallel=True)(_new_neuron_weights_nb)
+
+
+def _two_best(phi):
+    """
+    Build running argmax state for row-wise column updates
+
+    - tracks the best and second-best value per sample so the
+      argmax can be maintained incrementally as single columns
+      of phi change, instead of rescanning all neurons
+
+    Parameters
+    ==========
+    phi : np.array
+        - fuzzy layer output
+        - shape: (samples, neurons)
+
+    Returns
+    =======
+    best_val, best_idx, second_val : np.array
+        - best value, its neuron index and second-best value per sample
+        - shape: (samples,)
+    """
+    samples, neurons = phi.shape
+    if neurons == 1:
+        best_idx = np.zeros(samples, dtype=np.intp)
+        return phi[:, 0].copy(), best_idx, np.full(samples, -np.inf)
+
+    # partition so positions -2/-1 hold the two largest values
+    order = np.argpartition(phi, neurons - 2, axis=-1)
+    rows = np.arange(samples)
+    best_idx = order[:, -1]
+    return phi[rows, best_idx], best_idx, phi[rows, order[:, -2]]
+
+
+def _update_two_best(phi, col_idx, old_col, best_val, best_idx, second_val):
+    """
+    Update running argmax state after one column of phi changed
+
+    - amortized O(samples) versus a full argmax scan over neurons
+    - rows where the column value dropped are rebuilt from scratch
+      (cannot happen while widening, where outputs only grow)
+
+    Parameters
+    ==========
+    phi : np.array
+        - fuzzy layer output with column col_idx already updated
+        - shape: (samples, neurons)
+    col_idx : int
+        - index of updated column
+    old_col : np.array
+        - column values before the update
+        - shape: (samples,)
+    best_val, best_idx, second_val : np.array
+        - running argmax state from _two_best, updated in place
+    """
+    if phi.shape[-1] == 1:
+        best_val[:] = phi[:, 0]
+        return
+    col = phi[:, col_idx]
+
+    # rebuild rows invalidated by a decreased value
+    dropped = col < old_col
+    if dropped.any():
+        best_val[dropped], best_idx[dropped], second_val[dropped] = \
+            _two_best(phi[dropped])
+    grew = ~dropped
+
+    # updated column already holds the best slot
+    own = grew & (best_idx == col_idx)
+    best_val[own] = col[own]
+
+    # updated column newly overtakes the best
+    promote = grew & ~own & (col > best_val)
+    second_val[promote] = best_val[promote]
+    best_val[promote] = col[promote]
+    best_idx[promote] = col_idx
+
+    # updated column only overtakes the second best
+    mid = grew & ~own & ~promote & (col > second_val)
+    second_val[mid] = col[mid]
+
 
 class SelfOrganizer(object):
     """
@@ -79,6 +266,10 @@ class SelfOrganizer(object):
         - calculate minimum distance vector for calculating new neuron weights
     - prune_neurons :
         - remove unnecessary neurons from network architecture
+    - neuron_contributions :
+        - per-neuron contributions to raw model output
+    - predictions_from_raw :
+        - final model predictions from raw-output values
     - combine_membership_functions :
         - combine similar membership functions to simplify network
     """
@@ -95,6 +286,10 @@ class SelfOrganizer(object):
         self.network = None
         self.model = None
 
+        # cache of built models keyed by neuron count
+        # to avoid rebuilding the Keras graph on every resize
+        self._model_cache = {}
+
         # value checks for input parameters
 
         # center-widening factor
@@ -169,19 +364,21 @@ class SelfOrganizer(object):
         # create simple alias for self.network
         fuzzy_net = self.network
 
-        # get copy of initial fuzzy weights
-        start_weights = fuzzy_net.get_layer_weights(1)
-
         # widen centers if necessary
+        # and track whether any widths were modified
+        widened = False
+        start_weights = None
         if not fuzzy_net.if_part_criterion():
-            self.widen_centers()
+            # get copy of initial fuzzy weights before widening
+            start_weights = fuzzy_net.get_layer_weights(1)
+            widened = self.widen_centers()
 
         # add neuron if necessary
         if not fuzzy_net.error_criterion():
             # reset fuzzy weights if previously widened before adding
-            curr_weights = fuzzy_net.get_layer_weights(1)
-            if not np.array_equal(start_weights, curr_weights):
+            if widened:
                 fuzzy_net.get_layer(1).set_weights(start_weights)
+                fuzzy_net._clear_output_caches()
 
             # add neuron and retrain model (if added)
             added = self.add_neuron(**kwargs)
@@ -228,6 +425,11 @@ class SelfOrganizer(object):
             - threshold for error criterion whether new neuron to be added
         """
 
+        # drop models cached for a previous network
+        # - cache is keyed by neuron count only, so graphs built
+        #   for another dataset must not be reused
+        self._model_cache = {}
+
         # Fuzzy network as network attribute
         self.network = FuzzyNetwork(X_train, X_test, y_train, y_test,
                                     neurons=neurons, max_neurons=max_neurons,
@@ -319,19 +521,31 @@ class SelfOrganizer(object):
     def rebuild_model(self, new_weights, new_neurons, **kwargs):
         """
         Create updated FuzzyNetwork by adding or pruning neurons and updating to new weights
+
+        - built models are cached by neuron count so repeated
+          grows and prunes reuse an existing Keras graph
         """
-        # get config from current model and update output_dim of neuron layers
-        config = self.model.get_config()
-        for layer in config['layers']:
-            if 'output_dim' in layer['config']:
-                layer['config']['output_dim'] = new_neurons
-
-        # load new model from custom config data and load new weights
-        custom_objects = {'FuzzyLayer': FuzzyLayer,
-                          'NormalizedLayer': NormalizedLayer,
-                          'WeightedLayer': WeightedLayer,
-                          'OutputLayer': OutputLayer}
-        new_model = Model.from_config(config, custom_objects=custom_objects)
+        # stash current model for reuse at this neuron count
+        self._model_cache[self.network.neurons] = self.model
+
+        # reuse cached model of target size when available
+        new_model = self._model_cache.get(new_neurons)
+        if new_model is None:
+            # get config from current model and update output_dim of neuron layers
+            config = self.model.get_config()
+            for layer in config['layers']:
+                if 'output_dim' in layer['config']:
+                    layer['config']['output_dim'] = new_neurons
+
+            # load new model from custom config data
+            custom_objects = {'FuzzyLayer': FuzzyLayer,
+                              'NormalizedLayer': NormalizedLayer,
+                              'WeightedLayer': WeightedLayer,
+                              'OutputLayer': OutputLayer}
+            new_model = Model.from_config(config, custom_objects=custom_objects)
+            self._model_cache[new_neurons] = new_model
+
+        # load new weights
         new_model.set_weights(new_weights)
 
         # recompile model based on current model parameters
@@ -340,13 +554,20 @@ class SelfOrganizer(object):
         metrics = kwargs.get('metrics', self.model.metrics)
         new_model.compile(optimizer=optimizer, loss=loss, metrics=metrics, **kwargs)
 
-        # update neuron attribute
+        # update neuron attribute and drop stale cached outputs
         self.network.neurons = new_neurons
+        self.network._clear_output_caches()
         return new_model
 
     def widen_centers(self):
         """
         Widen center of neurons to better cover data
+
+        Returns
+        =======
+        widened : bool
+            - whether any widths were modified
+            - cheap dirty flag so callers need not compare weights
         """
         # print alert of successful widening
         if self.__debug:
@@ -361,33 +582,55 @@ class SelfOrganizer(object):
         # get old weights and create current weight vars
         c, s = fuzz_layer.get_weights()
 
+        # compute fuzzy layer output once
+        # then update only the widened column each iteration
+        # since no other column depends on the updated width
+        x = fuzzy_net.X_test
+        fuzz_out = fuzzy_net.fuzzy_firing(x)
+
+        # running per-sample argmax state over fuzz_out
+        # maintained incrementally as single columns change
+        best_val, best_idx, second_val = _two_best(fuzz_out)
+
         # repeat until if-part criterion satisfied
         # only perform for max iterations
         counter = 0
-        while not fuzzy_net.if_part_criterion():
+        while not fuzzy_net.if_part_criterion(phi=fuzz_out):
 
             counter += 1
             # check if max iterations exceeded
             if counter > self._max_widens:
+                # push updated widths to model before exiting
+                fuzz_layer.set_weights([c, s])
+                fuzzy_net._clear_output_caches()
                 if self.__debug:
                     print('Max iterations reached ({})'
                           .format(counter - 1))
-                return False
+                return True
 
             # get neuron with max-output for each sample
             # then select the most common one to update
-            fuzz_out = fuzzy_net.get_layer_output(1)
-            maxes = np.argmax(fuzz_out, axis=-1)
-            max_neuron = np.argmax(np.bincount(maxes.flat))
+            # - minlength fixes the histogram size across iterations
+            max_neuron = np.argmax(np.bincount(best_idx,
+                                               minlength=fuzzy_net.neurons))
 
             # select minimum width to expand
             # and multiply by factor
             mf_min = s[:, max_neuron].argmin()
             s[mf_min, max_neuron] = self._ksig * s[mf_min, max_neuron]
 
-            # update weights
-            new_weights = [c, s]
-            fuzz_layer.set_weights(new_weights)
+            # recompute output of widened neuron only
+            old_col = fuzz_out[:, max_neuron].copy()
+            fuzz_out[:, max_neuron] = np.exp(
+                -np.sum(np.square(x - c[:, max_neuron]) /
+                        (2 * np.square(s[:, max_neuron])), axis=-1))
+            _update_two_best(fuzz_out, max_neuron, old_col,
+                             best_val, best_idx, second_val)
+
+        # push updated widths to model
+        if counter:
+            fuzz_layer.set_weights([c, s])
+            fuzzy_net._clear_output_caches()
 
         # print alert of successful widening
         if self.__debug:
@@ -395,6 +638,7 @@ class SelfOrganizer(object):
                 print('Centers not widened')
             else:
                 print('Centers widened after {} iterations'.format(counter))
+        return counter > 0
 
     def add_neuron(self, **kwargs):
         """
@@ -411,15 +655,21 @@ class SelfOrganizer(object):
 
         # get weights for new neuron
         ck, sk = self.new_neuron_weights()
-        # expand dim for stacking
-        ck = np.expand_dims(ck, axis=-1)
-        sk = np.expand_dims(sk, axis=-1)
-        c_new = np.hstack((c_curr, ck))
-        s_new = np.hstack((s_curr, sk))
+
+        # preallocate expanded weight arrays and assign columns
+        # in place - no expand_dims/hstack intermediates
+        feats, neurons = c_curr.shape
+        c_new = np.empty((feats, neurons + 1), dtype=c_curr.dtype)
+        c_new[:, :neurons] = c_curr
+        c_new[:, neurons] = ck
+        s_new = np.empty((feats, neurons + 1), dtype=s_curr.dtype)
+        s_new[:, :neurons] = s_curr
+        s_new[:, neurons] = sk
 
         # update a vector to include column of 1s
-        a_add = np.ones((a_curr.shape[-2]))
-        a_new = np.column_stack((a_curr, a_add))
+        a_new = np.empty((a_curr.shape[-2], neurons + 1), dtype=a_curr.dtype)
+        a_new[:, :neurons] = a_curr
+        a_new[:, neurons] = 1
 
         # update weights to include new neurons
         w[0], w[1], w[2] = c_new, s_new, a_new
@@ -448,66 +698,67 @@ class SelfOrganizer(object):
                 print('Skipping pruning steps - only 1 neuron exists')
             return
 
+        # get per-neuron output contributions on training data
+        # - zeroing neuron k in the weighted layer only removes
+        #   its contribution from the raw output sum, so all
+        #   candidate predictions come from one forward pass
+        contribs = self.neuron_contributions(fuzzy_net.X_train)
+        raw_full = contribs.sum(axis=-1, keepdims=True)
+
         # get current training predictions
-        preds = self.model.predict(fuzzy_net.X_train)
+        preds = self.predictions_from_raw(raw_full)
 
         # calculate mean-absolute-error on training data
         E_rmse = mean_squared_error(fuzzy_net.y_train, preds)
 
-        # create duplicate model and get both sets of model weights
-        prune_model = self.duplicate_model()
+        # get actual model weights
         act_weights = self.model.get_weights()
 
-        # for each neuron, zero it out in prune model
+        # drop each neuron's contribution from the raw output
         # and get change in mae for dropping neuron
-        delta_E = []
-        for neuron in range(fuzzy_net.neurons):
-            # reset prune model weights to actual weights
-            prune_model.set_weights(act_weights)
-
-            # get current prune weights
-            w = prune_model.get_weights()
-            # zero our i neuron column in weighted vector
-            a = w[2]
-            a[:, neuron] = 0
-            prune_model.set_weights(w)
-
-            # predict values with new zeroed out weights
-            neur_pred = prune_model.predict(fuzzy_net.X_train)
-            neur_rmae = mean_absolute_error(fuzzy_net.y_train, neur_pred)
-
-            # append difference in rmse and new prediction rmse
-            delta_E.append(neur_rmae - E_rmse)
-
-        # convert delta_E to numpy array
-        delta_E = np.array(delta_E)
+        # - candidate predictions for all neurons built in one shot
+        # - cand shapes: (neurons, samples, 1/classes)
+        cand_raw = raw_full[np.newaxis] - contribs.T[:, :, np.newaxis]
+        cand_pred = self.predictions_from_raw(cand_raw)
+
+        # broadcast labels against candidate predictions
+        y_true = fuzzy_net.y_train
+        if y_true.ndim == 1:
+            y_true = y_true[:, np.newaxis]
+
+        # fill preallocated difference in rmse and prediction rmse
+        delta_E = np.empty(fuzzy_net.neurons)
+        delta_E[:] = np.abs(cand_pred - y_true[np.newaxis]).mean(axis=(1, 2)) - E_rmse
         # choose max of tolerance or threshold limit
         E = max(self._prune_tol * E_rmse, self._k_rmse)
 
+        # early out when even the least important neuron
+        # cannot be dropped below threshold
+        # - delta_E holds mae less E_rmse, so the best candidate
+        #   deletion has error delta_E.min() + E_rmse
+        if delta_E.min() + E_rmse >= E:
+            if self.__debug:
+                print('No neurons detected for pruning')
+            return False
+
         # iterate over each neuron in ascending importance
         # and prune until hit "important" neuron
+        # - keep a running raw-output sum and subtract candidate
+        #   contributions instead of re-running the model
         deleted = []
+        raw_run = raw_full.copy()
         # for each neuron up to second most important
         for neuron in delta_E.argsort()[:-1]:
-            # reset prune model weights to actual weights
-            prune_model.set_weights(act_weights)
-
-            # get current prune weights
-            w = prune_model.get_weights()
-            a = w[2]
-            # zero out previous deleted neurons
-            for delete in deleted:
-                a[:, delete] = 0
-            prune_model.set_weights(w)
-
-            # predict values with new zeroed out weights
-            neur_pred = prune_model.predict(fuzzy_net.X_train)
-            E_rmae_del = mean_absolute_error(fuzzy_net.y_train, neur_pred)
+            # drop candidate neuron's contribution from running sum
+            raw_try = raw_run - contribs[:, [neuron]]
+            neur_pred = self.predictions_from_raw(raw_try)
+            E_rmae_del = np.abs(neur_pred - y_true).mean()
 
             # if E_mae_del < E
             # delete neuron
             if E_rmae_del < E:
                 deleted.append(neuron)
+                raw_run = raw_try
                 continue
             # quit deleting if >= E
             else:
@@ -523,10 +774,8 @@ class SelfOrganizer(object):
                 print('Neurons to be deleted: ')
                 print(deleted)
 
-        # reset prune model weights to actual weights
-        prune_model.set_weights(act_weights)
-        # get current prune weights and remove deleted neurons
-        w = prune_model.get_weights()
+        # remove deleted neurons from actual weights
+        w = act_weights
         for i, weight in enumerate(w[:3]):
             w[i] = np.delete(weight, deleted, axis=-1)
 
@@ -540,6 +789,71 @@ class SelfOrganizer(object):
                   format(len(deleted), self.network.neurons))
         return True
 
+    def neuron_contributions(self, x):
+        """
+        Per-neuron contributions to raw model output
+
+        - weighted layer output for neuron k is
+            f(k) = psi(k) * (a(k) . [1, x])
+          and the raw output is the sum of f(k) across neurons
+        - allows building candidate predictions with
+          neurons zeroed out without re-running the model
+        - computed in float32: the prune decision is a threshold
+          comparison and tolerates reduced precision, while halving
+          bandwidth - training precision is unchanged
+
+        Parameters
+        ==========
+        x : np.array
+            - input data
+            - shape: (samples, features)
+
+        Returns
+        =======
+        contribs : np.array
+            - contribution of each neuron to raw output
+            - shape: (samples, neurons)
+        """
+        # get normalized firing levels from the NumPy fuzzy kernel
+        phi = self.network.fuzzy_firing(x)
+        psi = phi / phi.sum(axis=-1, keepdims=True)
+
+        # get weighted layer parameters
+        a = self.network.get_layer_weights(3)[0]
+
+        # prepend bias value to inputs then weight by firing levels
+        # - cast all factors to float32 so no operand silently
+        #   promotes the product to float64
+        aligned_b = np.column_stack((np.ones(x.shape[0], dtype=np.float32), x))
+        aligned_b = aligned_b.astype(np.float32, copy=False)
+        a = a.astype(np.float32, copy=False)
+        psi = psi.astype(np.float32, copy=False)
+        return psi * aligned_b.dot(a)
+
+    def predictions_from_raw(self, raw):
+        """
+        Final model predictions from raw-output values
+
+        - applies softmax layer weights for classification problems
+
+        Parameters
+        ==========
+        raw : np.array
+            - raw model output values
+            - shape: (samples, 1)
+        """
+        # raw output is final output for regression problems
+        if self.network.prob_type != 'classification':
+            return raw
+
+        # apply softmax layer to raw output
+        wd, bd = self.network.get_layer_weights('Softmax')
+        z = raw.dot(wd) + bd
+        # shift by max for numerical stability
+        z = z - z.max(axis=-1, keepdims=True)
+        e = np.exp(z)
+        return e / e.sum(axis=-1, keepdims=True)
+
     def new_neuron_weights(self, dist_thresh=1):
         """
         Return new c and s weights for k new fuzzy neuron
@@ -568,29 +882,49 @@ class SelfOrganizer(object):
 
         # get minimum distance vector
         min_dist = self.min_dist_vector()
-        # get minimum distance across neurons
-        # and arg-min for neuron with lowest distance
-        dist_vec = min_dist.min(axis=-1)
+
+        # use compiled kernel when Numba is available
+        if njit is not None:
+            return _new_neuron_weights_nb(x, c, s, min_dist, dist_thresh)
+
+        # arg-min for neuron with lowest distance
+        # then gather those distances instead of reducing again
         min_neurs = min_dist.argmin(axis=-1)
+        dist_vec = np.take_along_axis(min_dist, min_neurs[:, np.newaxis],
+                                      axis=-1).squeeze(-1)
 
         # get min c and s weights
-        c_min = c[:, min_neurs].diagonal()
-        s_min = s[:, min_neurs].diagonal()
+        # gather one entry per feature directly instead of
+        # fancy-indexing a (features, features) matrix
+        # just to take its diagonal
+        feat_idx = np.arange(c.shape[0])
+        c_min = c[feat_idx, min_neurs]
+        s_min = s[feat_idx, min_neurs]
         assert c_min.shape == s_min.shape
 
         # set threshold distance as factor of mean
         # value for each feature across samples
-        kd_i = x.mean(axis=0) * dist_thresh
+        x_mean = x.mean(axis=0)
+        kd_i = x_mean * dist_thresh
 
         # get final weight vectors
-        ck = np.where(dist_vec <= kd_i, c_min, x.mean(axis=0))
-        sk = np.where(dist_vec <= kd_i, s_min, dist_vec)
+        # start from fallback values and overwrite in place
+        # where within threshold distance
+        mask = dist_vec <= kd_i
+        ck = x_mean.copy()
+        np.copyto(ck, c_min, where=mask)
+        sk = dist_vec.copy()
+        np.copyto(sk, s_min, where=mask)
         return ck, sk
 
     def min_dist_vector(self):
         """
         Get minimum distance vector
 
+        - broadcasts x directly against c so each sample is
+          compared to every center (an earlier repeat/reshape
+          version misaligned c across samples)
+
         Returns
         =======
         min_dist : np.array
@@ -603,17 +937,21 @@ class SelfOrganizer(object):
 
         # get input values and fuzzy weights
         x = fuzzy_net.X_train
-        samples = x.shape[0]
         c, s = fuzzy_net.get_layer_weights(1)
 
-        # align x and c and assert matching dims
-        aligned_x = x.repeat(fuzzy_net.neurons). \
-            reshape(x.shape + (fuzzy_net.neurons,))
-        aligned_c = c.repeat(samples).reshape((samples,) + c.shape)
-        assert aligned_x.shape == aligned_c.shape
+        # use compiled kernel when Numba is available
+        if njit is not None:
+            return _min_dist_vector_nb(x, c)
+
+        # broadcast x against c
+        # to avoid materializing aligned copies of either
+        # x    : (samples, features) -> (samples, features, 1)
+        # c    : (features, neurons) -> (1, features, neurons)
+        # diff : (samples, features, neurons)
+        diff = np.abs(x[:, :, np.newaxis] - c[np.newaxis, :, :])
 
         # average the minimum distance across samples
-        return np.abs(aligned_x - aligned_c).mean(axis=0)
+        return diff.mean(axis=0)
 
     # TODO: add method combining membership functions
     def combine_membership_functions(self, **kwargs):